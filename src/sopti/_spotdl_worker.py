@@ -0,0 +1,97 @@
+"""Long-lived spotdl download worker.
+
+Spawned once per SpotDLWrapper as ``python -u -m sopti._spotdl_worker`` so the
+spotdl/yt-dlp imports and the Spotify auth handshake are paid a single time
+instead of once per invocation. The parent speaks a line protocol on stdio:
+each stdin line is one job of whitespace-separated track URLs; the worker
+answers with ``OK <url>`` / ``FAIL <url>`` per track followed by ``DONE``.
+
+Jobs are batched rather than one URL per line so spotdl's internal downloader
+still parallelizes across the batch with ``threads`` workers.
+"""
+
+from __future__ import annotations
+import sys
+from argparse import ArgumentParser
+
+
+def get_parser() -> ArgumentParser:
+    parser = ArgumentParser(prog="sopti._spotdl_worker")
+    parser.add_argument("--output", required=True)
+    parser.add_argument("--archive", required=True)
+    parser.add_argument("--threads", type=int, default=3)
+    parser.add_argument("--format", default=None)
+    parser.add_argument("--bitrate", default=None)
+    parser.add_argument("--client-id", dest="client_id", default=None)
+    parser.add_argument("--client-secret", dest="client_secret", default=None)
+    parser.add_argument("--user-auth", action="store_true")
+    return parser
+
+
+def main() -> int:
+    args = get_parser().parse_args()
+
+    # The protocol owns the real stdout; route spotdl's console noise to
+    # stderr so it cannot corrupt the result stream.
+    proto = sys.stdout
+    sys.stdout = sys.stderr
+
+    from spotdl import Spotdl
+    from spotdl.types.song import Song
+    from spotdl.utils.config import DEFAULT_CONFIG
+
+    downloader_settings: dict = {
+        "output": args.output,
+        "archive": args.archive,
+        "overwrite": "skip",
+        "threads": args.threads,
+        "simple_tui": True,
+    }
+    if args.format:
+        downloader_settings["format"] = args.format
+    if args.bitrate:
+        downloader_settings["bitrate"] = args.bitrate
+
+    # The spotdl CLI substitutes its bundled public credentials when none
+    # are given; the Python API does not, so mirror that fallback here to
+    # keep the no --login path working.
+    spotdl = Spotdl(
+        client_id=args.client_id or DEFAULT_CONFIG["client_id"],
+        client_secret=args.client_secret or DEFAULT_CONFIG["client_secret"],
+        user_auth=args.user_auth,
+        downloader_settings=downloader_settings,
+    )
+
+    for line in sys.stdin:
+        urls = line.split()
+        if not urls:
+            continue
+
+        songs: list[Song] = []
+        failed: list[str] = []
+        for url in urls:
+            try:
+                songs.append(Song.from_url(url))
+            except Exception:
+                failed.append(url)
+
+        results = []
+        if songs:
+            try:
+                results = spotdl.download_songs(songs)
+            except Exception:
+                failed.extend(s.url for s in songs)
+                results = []
+
+        for song, path in results:
+            status = "OK" if path else "FAIL"
+            print(f"{status} {song.url}", file=proto, flush=True)
+        for url in failed:
+            print(f"FAIL {url}", file=proto, flush=True)
+        print("DONE", file=proto, flush=True)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,9 +4,13 @@ from argparse import (
     ArgumentDefaultsHelpFormatter,
     RawTextHelpFormatter,
 )
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from signal import getsignal, signal, SIGINT, SIGTERM
+from threading import Event
 from .config import Config
 from .orchestrator import Orchestrator
+from .spotify_api import get_client
 from .utils.logging import setup_logging
 from .utils.cli import positive_int, ensure_dependencies, looks_like_spotify_url
 
@@ -176,6 +180,32 @@ def get_profiles(args, config: Config) -> list[str]:
     return profiles
 
 
+def _run_one(
+    profile: str,
+    dest: Path,
+    workers: int,
+    preferred_format: str,
+    bitrate: str,
+    quiet: bool,
+    user_auth: bool,
+    config: Config,
+    cancel_event: Event,
+) -> None:
+    orchestrator = Orchestrator(
+        profile_url=profile,
+        dest=dest,
+        max_workers=workers,
+        cancel_event=cancel_event,
+    )
+    orchestrator.preferred_format = preferred_format
+    orchestrator.bitrate = bitrate
+    orchestrator.client_id = config.data.get("spotify_client_id")
+    orchestrator.client_secret = config.data.get("spotify_client_secret")
+    orchestrator.verbose = not quiet
+    orchestrator.user_auth = user_auth
+    orchestrator.run()
+
+
 def process_profiles(
     profiles: list[str],
     dest: Path,
@@ -186,27 +216,66 @@ def process_profiles(
     user_auth: bool,
     config: Config,
 ) -> None:
-    for p in profiles:
-        try:
-            orchestrator = Orchestrator(profile_url=p, dest=dest, max_workers=workers)
-            orchestrator.preferred_format = preferred_format
-            orchestrator.bitrate = bitrate
-            orchestrator.client_id = config.data.get("spotify_client_id")
-            orchestrator.client_secret = config.data.get("spotify_client_secret")
-            orchestrator.verbose = not quiet
-            orchestrator.user_auth = user_auth
-            orchestrator.run()
-        except KeyboardInterrupt:
-            if not quiet:
-                print("\nCancelled by user.")
-            logger.info(f"Processing of {p} cancelled by user.")
-            break
-        except SystemExit:
-            # Allow SystemExit to propagate for controlled exits
-            raise
-        except Exception as e:
-            msg = f"Failed processing {p}: {e}"
-            logger.error(msg, exc_info=True)
-            if not quiet:
-                print(msg)
-            continue
+    # Profiles are independent I/O-bound jobs; overlap extraction for one
+    # with downloads for another. Each orchestrator opens its own SQLite
+    # connection, which WAL mode allows concurrently.
+    # Warm the playlist-name cache in one concurrent batch so each
+    # orchestrator's lookup is a dict hit instead of its own round-trip.
+    playlist_urls = [p for p in profiles if "/playlist/" in p]
+    if playlist_urls:
+        get_client(
+            config.data.get("spotify_client_id", ""),
+            config.data.get("spotify_client_secret", ""),
+        ).get_playlist_names(playlist_urls)
+
+    cancel_event = Event()
+    old_sigint = getsignal(SIGINT)
+    old_sigterm = getsignal(SIGTERM)
+
+    def _on_signal(signum, frame):
+        if cancel_event.is_set():
+            # Second signal: hand back to the previous handlers so
+            # another Ctrl+C force-quits instead of being swallowed.
+            signal(SIGINT, old_sigint)
+            signal(SIGTERM, old_sigterm)
+            return
+        logger.info(f"Signal {signum} received. Cancelling profile processing.")
+        cancel_event.set()
+
+    signal(SIGINT, _on_signal)
+    signal(SIGTERM, _on_signal)
+
+    try:
+        with ThreadPoolExecutor(max_workers=min(len(profiles), 4)) as executor:
+            futures = {
+                executor.submit(
+                    _run_one,
+                    p,
+                    dest,
+                    workers,
+                    preferred_format,
+                    bitrate,
+                    quiet,
+                    user_auth,
+                    config,
+                    cancel_event,
+                ): p
+                for p in profiles
+            }
+            for future in as_completed(futures):
+                p = futures[future]
+                try:
+                    future.result()
+                except Exception as e:
+                    msg = f"Failed processing {p}: {e}"
+                    logger.error(msg, exc_info=True)
+                    if not quiet:
+                        print(msg)
+    except KeyboardInterrupt:
+        cancel_event.set()
+        if not quiet:
+            print("\nCancelled by user.")
+        logger.info("Profile processing cancelled by user.")
+    finally:
+        signal(SIGINT, old_sigint)
+        signal(SIGTERM, old_sigterm)
@@ -1,13 +1,24 @@
 from __future__ import annotations
 from pathlib import Path
-from json import load, dump
 from os import getenv
+from .utils.path_utils import ensure_dir
+
+try:
+    # orjson parses/serializes at C speed; fall back to stdlib when absent.
+    from orjson import OPT_INDENT_2, dumps as _orjson_dumps, loads as _loads
+
+    def _dumps(data: dict) -> bytes:
+        return _orjson_dumps(data, option=OPT_INDENT_2)
+except ImportError:
+    from json import dumps as _json_dumps, loads as _loads
+
+    def _dumps(data: dict) -> bytes:
+        return _json_dumps(data, indent=4).encode("utf-8")
 
 
 class Config:
     def __init__(self) -> None:
-        self.config_dir = Path.home() / ".config" / "sopti"
-        self.config_dir.mkdir(parents=True, exist_ok=True)
+        self.config_dir = ensure_dir(Path.home() / ".config" / "sopti")
         self.config_file = self.config_dir / "config.json"
         self.default_config = {
             "music_dir": str(Path.home() / "Music"),
@@ -21,13 +32,12 @@ class Config:
         self.data = self.load()
 
     def load(self) -> dict:
-        if self.config_file.exists():
-            with open(self.config_file, "r", encoding="utf-8") as f:
-                return load(f)
-        else:
+        # Single open/read/close in C on the happy path.
+        try:
+            return _loads(self.config_file.read_bytes())
+        except FileNotFoundError:
             self.save(self.default_config)
             return self.default_config
 
     def save(self, data: dict) -> None:
-        with open(self.config_file, "w", encoding="utf-8") as f:
-            dump(data, f, indent=4)
+        self.config_file.write_bytes(_dumps(data))
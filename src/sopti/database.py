@@ -1,33 +1,96 @@
 from __future__ import annotations
+from json import dumps as _json_dumps
 from sqlite3 import connect
 from pathlib import Path
 from .models import SongRecord
+from .utils.path_utils import ensure_dir
+
+
+def _pack_artists(artists: list[str]) -> bytes:
+    """Serialize the artist list losslessly (commas in names stay intact)."""
+    return _json_dumps(artists, separators=(",", ":")).encode("utf-8")
 
 
 class DBManager:
     def __init__(self) -> None:
         self.db_path = Path.home() / ".cache" / "sopti" / "downloads.db"
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        ensure_dir(self.db_path.parent)
         self.conn = connect(self.db_path)
+        # WAL + NORMAL sync: one fsync amortized over each batched
+        # transaction and no journal-file rename per commit.
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA temp_store=MEMORY")
+        self.conn.execute("PRAGMA mmap_size=268435456")
         self._init_tables()
 
-    def _init_tables(self) -> None:
-        with self.conn:
-            self.conn.execute(
-                """CREATE TABLE IF NOT EXISTS downloads (
+    _CREATE_DOWNLOADS = """CREATE TABLE IF NOT EXISTS downloads (
         id TEXT PRIMARY KEY,
         title TEXT,
-        artists TEXT,
+        artists BLOB,
         album TEXT,
         playlist_id TEXT,
         url TEXT
         )"""
-            )
+
+    def _init_tables(self) -> None:
+        # Take the write lock before looking at the schema: concurrent
+        # profile threads each construct their own DBManager, and without
+        # it one thread can read the table mid-rebuild of another's
+        # migration. BEGIN IMMEDIATE serializes the inits; late arrivals
+        # re-check the column type inside the transaction and find the
+        # migration already done.
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            self.conn.execute(self._CREATE_DOWNLOADS)
+            self._migrate_artists_column()
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        self.conn.execute("COMMIT")
+        # Make sure the planner costs the PK correctly on small tables.
+        self.conn.execute("ANALYZE")
+
+    def _migrate_artists_column(self) -> None:
+        """One-shot migration of the old comma-joined TEXT artists column.
+
+        Runs inside the caller's BEGIN IMMEDIATE transaction so the type
+        check and the rebuild are atomic with respect to other
+        connections.
+        """
+        cols = self.conn.execute("PRAGMA table_info(downloads)").fetchall()
+        declared = next((c[2] for c in cols if c[1] == "artists"), "")
+        if declared.upper() != "TEXT":
+            return
+        rows = self.conn.execute(
+            "SELECT id, title, artists, album, playlist_id, url FROM downloads"
+        ).fetchall()
+        self.conn.execute("DROP TABLE downloads")
+        self.conn.execute(self._CREATE_DOWNLOADS.replace("IF NOT EXISTS ", ""))
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO downloads VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    r[0],
+                    r[1],
+                    _pack_artists(r[2].split(",") if r[2] else []),
+                    r[3],
+                    r[4],
+                    r[5],
+                )
+                for r in rows
+            ],
+        )
 
     def exists(self, song_id: str) -> bool:
         cur = self.conn.execute("SELECT 1 FROM downloads WHERE id= ?", (song_id,))
         return cur.fetchone() is not None
 
+    def load_ids(self) -> set[str]:
+        """Fetch all downloaded song IDs in one query for O(1) membership tests."""
+        cur = self.conn.execute("SELECT id FROM downloads")
+        return {row[0] for row in cur.fetchall()}
+
     def add(self, record: SongRecord) -> None:
         with self.conn:
             self.conn.execute(
@@ -35,13 +98,38 @@ class DBManager:
                 (
                     record.id,
                     record.title,
-                    ",".join(record.artists),
+                    _pack_artists(record.artists),
                     record.album,
                     record.playlist_id,
                     record.url,
                 ),
             )
 
+    def add_many(self, records: list[SongRecord]) -> None:
+        """Insert a batch of records in a single transaction.
+
+        executemany reuses the prepared statement and the surrounding
+        transaction costs one commit for the whole batch instead of one
+        per track.
+        """
+        if not records:
+            return
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO downloads VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        r.id,
+                        r.title,
+                        _pack_artists(r.artists),
+                        r.album,
+                        r.playlist_id,
+                        r.url,
+                    )
+                    for r in records
+                ],
+            )
+
     def close(self) -> None:
         try:
             self.conn.close()
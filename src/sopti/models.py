@@ -1,5 +1,6 @@
 from __future__ import annotations
 from dataclasses import dataclass
+from sys import intern
 from typing import List
 
 
@@ -11,3 +12,11 @@ class SongRecord:
     album: str
     playlist_id: str
     url: str
+
+    def __post_init__(self) -> None:
+        # Album, playlist and artist strings repeat heavily across a
+        # playlist; interning dedups them and speeds up set membership.
+        # id/url are unique per record and stay as-is.
+        self.album = intern(self.album)
+        self.playlist_id = intern(self.playlist_id)
+        self.artists = [intern(a) for a in self.artists]
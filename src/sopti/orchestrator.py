@@ -1,7 +1,7 @@
 from __future__ import annotations
+from contextlib import contextmanager
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor, as_completed, Future, TimeoutError
-from threading import Event
+from threading import Event, current_thread, main_thread
 from signal import getsignal, signal, SIGINT, SIGTERM
 from tqdm import tqdm
 from .spotdl_integration.extractor import PlaylistExtractor
@@ -16,12 +16,20 @@ logger = setup_logging(__name__)
 
 
 class Orchestrator:
-    def __init__(self, profile_url: str, dest: Path, max_workers: int | None = None):
+    def __init__(
+        self,
+        profile_url: str,
+        dest: Path,
+        max_workers: int | None = None,
+        cancel_event: Event | None = None,
+    ):
         self.profile_url = profile_url
         self.dest = dest
         self.db = DBManager()
         self.config = Config()
         self.max_workers = max_workers or self.config.data.get("workers", 3)
+        # Shared by the caller when several profiles run concurrently.
+        self.cancel_event = cancel_event or Event()
         self._set_default_attributes()
 
     def _set_default_attributes(self) -> None:
@@ -33,111 +41,79 @@ class Orchestrator:
         self.verbose: bool = True
 
     def _download_batch(
-        self, wrapper: SpotDLWrapper, songs: list[SongRecord], cancel_event: Event
+        self,
+        wrapper: SpotDLWrapper,
+        songs: list[SongRecord],
+        cancel_event: Event,
+        done_ids: set[str],
+        pbar: tqdm | None = None,
     ) -> tuple[int, int, bool]:
-        success_count = 0
-        fail_count = 0
         cancelled = False
 
-        # Store original signal handlers
+        try:
+            succeeded = wrapper.download_many(
+                songs,
+                cancel_event,
+                progress_cb=pbar.update if pbar else None,
+            )
+        except KeyboardInterrupt:
+            logger.info("KeyboardInterrupt detected during download batch.")
+            cancel_event.set()
+            succeeded = []
+
+        # Flush the whole pass in one transaction at the batch boundary.
+        self.db.add_many(succeeded)
+        done_ids.update(song.id for song in succeeded)
+
+        cancelled = cancelled or cancel_event.is_set()
+        success_count = len(succeeded)
+        fail_count = len(songs) - success_count
+        return success_count, fail_count, cancelled
+
+    @contextmanager
+    def _install_cancel_handlers(self, cancel_event: Event):
+        """Point SIGINT/SIGTERM at the cancel event for the duration of a run.
+
+        Installed once per run rather than per pass, which avoids the
+        save/restore race between passes. signal() is only legal from the
+        main thread; when profiles run in worker threads the caller owns
+        the handlers and the shared event, so this becomes a no-op.
+        """
+        if current_thread() is not main_thread():
+            yield
+            return
+
         old_sigint = getsignal(SIGINT)
         old_sigterm = getsignal(SIGTERM)
 
         def _on_signal(signum, frame):
+            if cancel_event.is_set():
+                # Second signal: hand back to the previous handlers so
+                # another Ctrl+C force-quits instead of being swallowed.
+                signal(SIGINT, old_sigint)
+                signal(SIGTERM, old_sigterm)
+                return
             logger.info(f"Signal {signum} received. Setting cancellation event.")
             cancel_event.set()
 
-        # Set new signal handlers
         signal(SIGINT, _on_signal)
         signal(SIGTERM, _on_signal)
-
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            pbar = None
-            if self.verbose:
-                pbar = tqdm(
-                    total=len(songs), desc="Downloading", unit="track", leave=True
-                )
-
-            futures: dict[Future, SongRecord] = {
-                executor.submit(wrapper.download, song, cancel_event): song
-                for song in songs[: self.max_workers]
-            }
-            song_iterator = iter(songs[self.max_workers :])
-
-            try:
-                while futures and not cancel_event.is_set():
-                    try:
-                        # Wait for any future to complete, with a small timeout to check cancel_event
-                        finished_futures = as_completed(futures.keys(), timeout=0.5)
-                        for finished in finished_futures:
-                            song = futures.pop(finished)
-                            try:
-                                ok = finished.result()
-                            except Exception as e:
-                                logger.error(
-                                    f"Error in download task for {song.url}: {e}",
-                                    exc_info=True,
-                                )
-                                ok = False
-
-                            if ok:
-                                self.db.add(song)
-                                success_count += 1
-                            else:
-                                fail_count += 1
-
-                            if pbar:
-                                pbar.update(1)
-
-                            # Submit a new task if available
-                            try:
-                                next_song = next(song_iterator)
-                                futures[
-                                    executor.submit(
-                                        wrapper.download, next_song, cancel_event
-                                    )
-                                ] = next_song
-                            except StopIteration:
-                                pass
-                    except TimeoutError:
-                        # No future completed in the last 0.5 seconds, check cancellation event
-                        pass
-                    except KeyboardInterrupt:
-                        logger.info("KeyboardInterrupt detected during download batch.")
-                        cancelled = True
-                        cancel_event.set()
-                        break
-            except KeyboardInterrupt:
-                logger.info("KeyboardInterrupt detected outside future loop.")
-                cancelled = True
-                cancel_event.set()
-            finally:
-                if pbar:
-                    pbar.close()
-                # Restore original signal handlers
-                signal(SIGINT, old_sigint)
-                signal(SIGTERM, old_sigterm)
-                if cancelled:
-                    # If cancelled, ensure all running futures are cancelled
-                    for future in futures:
-                        future.cancel()
-                    executor.shutdown(wait=False, cancel_futures=True)
-                else:
-                    executor.shutdown(
-                        wait=True
-                    )  # Wait for all tasks to complete if not cancelled
-
-        return success_count, fail_count, cancelled
+        try:
+            yield
+        finally:
+            signal(SIGINT, old_sigint)
+            signal(SIGTERM, old_sigterm)
 
     def run(self) -> None:
         try:
-            extractor = self._get_extractor()
-            songs = self._extract_songs(extractor)
-            if songs is None:
-                return
+            with self._install_cancel_handlers(self.cancel_event):
+                extractor = self._get_extractor()
+                songs = self._extract_songs(extractor)
+                if songs is None:
+                    return
 
-            dest = self._get_destination(extractor)
-            self._download_songs(songs, dest)
+                dest = self._get_destination(extractor)
+                self._download_songs(songs, dest)
         finally:
             self.db.close()
 
@@ -150,22 +126,65 @@ class Orchestrator:
             client_secret=self.client_secret,
             verbose=self.verbose,
             user_auth=self.user_auth,
+            workers=self.max_workers,
         )
 
-        cancel_event = Event()
-        max_passes = 3
+        try:
+            self._run_download_passes(songs, wrapper)
+        finally:
+            wrapper.close()
+
+    def _run_download_passes(
+        self, songs: list[SongRecord], wrapper: SpotDLWrapper
+    ) -> None:
         total_songs = len(songs)
 
-        # Initial count of already downloaded songs
-        initial_downloaded_count = sum(1 for s in songs if self.db.exists(s.id))
-        previous_downloaded_count = initial_downloaded_count
+        # One query up front; membership tests afterwards are set lookups.
+        done_ids = self.db.load_ids()
+        initial_downloaded_count = sum(1 for s in songs if s.id in done_ids)
+        downloaded_count = initial_downloaded_count
 
         logger.info(
             f"Starting download process for {total_songs} songs. {initial_downloaded_count} already in DB."
         )
 
+        # One bar spans all passes: it tracks the downloaded set, so a
+        # retry pass resumes the same bar instead of restarting a new one.
+        pbar = None
+        if self.verbose:
+            pbar = tqdm(
+                total=total_songs,
+                initial=initial_downloaded_count,
+                desc="Downloading",
+                unit="track",
+                leave=True,
+            )
+        try:
+            self._run_pass_loop(songs, wrapper, pbar, done_ids, downloaded_count)
+        finally:
+            if pbar:
+                pbar.close()
+
+    def _run_pass_loop(
+        self,
+        songs: list[SongRecord],
+        wrapper: SpotDLWrapper,
+        pbar: tqdm | None,
+        done_ids: set[str],
+        downloaded_count: int,
+    ) -> None:
+        cancel_event = self.cancel_event
+        max_passes = 3
+        backoff_factor = 2.0
+        total_songs = len(songs)
+
         for attempt in range(1, max_passes + 1):
-            pending_songs = [s for s in songs if not self.db.exists(s.id)]
+            if attempt > 1:
+                # Concurrent profile runs share the database; refresh the
+                # snapshot so tracks they completed between passes are not
+                # resubmitted to the worker.
+                done_ids.update(self.db.load_ids())
+            pending_songs = [s for s in songs if s.id not in done_ids]
             if not pending_songs:
                 logger.info(
                     "All pending songs downloaded or no songs to download. Breaking loop."
@@ -173,7 +192,7 @@ class Orchestrator:
                 break
 
             if self.verbose:
-                print(
+                tqdm.write(
                     f"Pass {attempt}/{max_passes}: {len(pending_songs)} tracks pending download."
                 )
             logger.info(
@@ -181,31 +200,37 @@ class Orchestrator:
             )
 
             s_ok, s_fail, cancelled = self._download_batch(
-                wrapper, pending_songs, cancel_event
+                wrapper, pending_songs, cancel_event, done_ids, pbar
             )
 
             if cancelled:
                 logger.info("Download process cancelled by user.")
                 if self.verbose:
-                    print("\nDownload process cancelled.")
+                    tqdm.write("\nDownload process cancelled.")
                 return
 
-            current_downloaded_count = sum(1 for s in songs if self.db.exists(s.id))
-            if current_downloaded_count == previous_downloaded_count:
+            downloaded_count += s_ok
+            if s_ok == 0:
                 logger.info(
                     "No further progress detected in this pass. Stopping early."
                 )
                 if self.verbose:
-                    print("No further progress detected. Stopping.")
+                    tqdm.write("No further progress detected. Stopping.")
                 break
-            previous_downloaded_count = current_downloaded_count
 
-        final_downloaded_count = sum(1 for s in songs if self.db.exists(s.id))
+            # Retry/backoff happens at the batch level: wait briefly before
+            # re-running the remaining tracks in the next pass. Event.wait
+            # returns immediately when cancellation preempts the backoff.
+            if s_fail and attempt < max_passes:
+                if cancel_event.wait(timeout=backoff_factor**attempt):
+                    logger.info("Cancellation detected during backoff.")
+                    return
+
         logger.info(
-            f"Download process finished. Total completed: {final_downloaded_count}/{total_songs}"
+            f"Download process finished. Total completed: {downloaded_count}/{total_songs}"
         )
         if self.verbose:
-            print(f"Completed: {final_downloaded_count}/{total_songs} in database")
+            tqdm.write(f"Completed: {downloaded_count}/{total_songs} in database")
 
     def _get_destination(self, extractor: PlaylistExtractor) -> Path:
         if "/playlist/" in self.profile_url:
@@ -232,6 +257,7 @@ class Orchestrator:
             client_id=self.client_id,
             client_secret=self.client_secret,
             user_auth=self.user_auth,
+            cancel_event=self.cancel_event,
         )
 
     def _extract_songs(self, extractor: PlaylistExtractor) -> list[SongRecord] | None:
@@ -247,6 +273,11 @@ class Orchestrator:
                 print("\nCancelled by user during extraction.")
             return None
         except Exception as e:
+            if self.cancel_event.is_set():
+                logger.info("Playlist extraction cancelled by user.")
+                if self.verbose:
+                    print("\nCancelled by user during extraction.")
+                return None
             logger.error(
                 f"Error during playlist extraction for {self.profile_url}: {e}",
                 exc_info=True,
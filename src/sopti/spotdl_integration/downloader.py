@@ -1,13 +1,24 @@
 from __future__ import annotations
+import sys
+from os import read as _os_read, scandir as _os_scandir, unlink as _os_unlink
+from selectors import DefaultSelector, EVENT_READ
 from subprocess import Popen, PIPE, TimeoutExpired
-from time import sleep
 from pathlib import Path
 from threading import Event
+from typing import Callable
 from ..models import SongRecord
 from ..utils.logging import setup_logging
+from ..utils.path_utils import ensure_dir
 
 logger = setup_logging(__name__)
 
+_READ_CHUNK = 65536
+
+
+def _track_id(url: str) -> str:
+    """Return the trailing Spotify track ID of a track URL."""
+    return url.split("?", 1)[0].rstrip("/").rsplit("/", 1)[-1]
+
 
 class SpotDLWrapper:
     def __init__(
@@ -19,6 +30,7 @@ class SpotDLWrapper:
         client_secret: str | None = None,
         verbose: bool = True,
         user_auth: bool = False,
+        workers: int = 3,
     ):
         self.dest = dest
         self.preferred_format = preferred_format
@@ -27,29 +39,53 @@ class SpotDLWrapper:
         self.client_secret = client_secret
         self.user_auth = user_auth
         self.verbose = verbose
-        self.dest.mkdir(parents=True, exist_ok=True)
+        self.workers = workers
+        ensure_dir(self.dest)
         self.archive_file = self.dest / ".sopti-archive.txt"
+        # One long-lived worker amortizes the spotdl import and Spotify
+        # auth handshake across every pass; restarted on crash.
+        self._worker: Popen | None = None
 
     def _cleanup_partials(self) -> None:
-        for p in self.dest.glob("**/*.part"):
+        # scandir returns the entry type from the dirent, so the walk costs
+        # one readdir per directory instead of a stat per entry like glob.
+        stack = [str(self.dest)]
+        while stack:
             try:
-                p.unlink(missing_ok=True)
+                with _os_scandir(stack.pop()) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.name.endswith(".part"):
+                            try:
+                                _os_unlink(entry.path)
+                            except OSError as e:
+                                logger.warning(
+                                    f"Failed to remove partial file {entry.path}: {e}"
+                                )
             except OSError as e:
-                logger.warning(f"Failed to remove partial file {p}: {e}")
+                logger.warning(f"Failed to scan directory during cleanup: {e}")
 
-    def download(self, song: SongRecord, cancel_event: Event | None = None) -> bool:
+    def _read_archive(self) -> set[str]:
+        """Return the set of entries spotdl has recorded in the archive file."""
+        try:
+            with open(self.archive_file, "r", encoding="utf-8") as f:
+                return {line.strip() for line in f if line.strip()}
+        except OSError:
+            return set()
+
+    def _worker_cmd(self) -> list[str]:
         cmd = [
-            "spotdl",
-            "download",
-            song.url,
+            sys.executable,
+            "-u",
+            "-m",
+            "sopti._spotdl_worker",
             "--output",
             str(self.dest),
-            "--overwrite",
-            "skip",
-            "--threads",
-            "1",
             "--archive",
             str(self.archive_file),
+            "--threads",
+            str(self.workers),
         ]
         if self.preferred_format:
             cmd.extend(["--format", self.preferred_format])
@@ -61,96 +97,145 @@ class SpotDLWrapper:
             cmd.extend(["--client-secret", self.client_secret])
         if self.user_auth:
             cmd.append("--user-auth")
+        return cmd
 
-        max_attempts = 5
-        backoff_factor = 2.0
+    def _ensure_worker(self) -> Popen:
+        if self._worker is None or self._worker.poll() is not None:
+            logger.info("Spawning spotdl worker process.")
+            self._worker = Popen(
+                self._worker_cmd(),
+                stdin=PIPE,
+                stdout=PIPE,
+                stderr=PIPE,
+                bufsize=0,
+            )
+        return self._worker
 
-        for attempt in range(1, max_attempts + 1):
-            if cancel_event and cancel_event.is_set():
-                logger.info(f"Download cancelled for {song.url}")
-                self._cleanup_partials()
-                return False
+    def _kill_worker(self) -> None:
+        if self._worker is None:
+            return
+        proc, self._worker = self._worker, None
+        if proc.poll() is None:
+            proc.terminate()
+            try:
+                proc.wait(timeout=5)
+            except TimeoutExpired:
+                proc.kill()
 
-            proc: Popen | None = None
+    def close(self) -> None:
+        """Shut down the worker process."""
+        if self._worker is not None and self._worker.poll() is None:
             try:
-                logger.info(f"Attempt {attempt}/{max_attempts} to download {song.url}")
-                proc = Popen(cmd, stdout=PIPE, stderr=PIPE, text=True)
-                stdout_lines: list[str] = []
-                stderr_lines: list[str] = []
-
-                while proc.poll() is None:
-                    if cancel_event and cancel_event.is_set():
-                        logger.info(
-                            f"Cancellation detected for {song.url}. Terminating process."
-                        )
-                        proc.terminate()
-                        try:
-                            proc.wait(timeout=5)
-                        except TimeoutExpired:
-                            proc.kill()
-                        self._cleanup_partials()
-                        return False
+                self._worker.stdin.close()
+                self._worker.wait(timeout=5)
+            except (OSError, TimeoutExpired):
+                pass
+        self._kill_worker()
+
+    def _succeeded_songs(self, songs: list[SongRecord]) -> list[SongRecord]:
+        """Match songs against the archive file to attribute per-track success.
+
+        Fallback for when the worker dies mid-batch and the protocol stream
+        is incomplete: spotdl records one archive entry per completed track.
+        """
+        archive = self._read_archive()
+        archive_tails = {_track_id(entry) for entry in archive}
+        return [
+            s
+            for s in songs
+            if s.url in archive or _track_id(s.url) in archive_tails
+        ]
 
+    def download_many(
+        self,
+        songs: list[SongRecord],
+        cancel_event: Event | None = None,
+        progress_cb: Callable[[int], None] | None = None,
+    ) -> list[SongRecord]:
+        """Download all songs as one job through the persistent worker.
+
+        Returns the subset of songs that completed; retry happens at the
+        batch level in the orchestrator, not per track.
+        """
+        if not songs:
+            return []
+        if cancel_event and cancel_event.is_set():
+            logger.info("Download batch cancelled before start.")
+            return []
+
+        proc = self._ensure_worker()
+        logger.info(f"Submitting batch of {len(songs)} tracks to spotdl worker.")
+        try:
+            job = " ".join(s.url for s in songs) + "\n"
+            proc.stdin.write(job.encode("utf-8"))
+            proc.stdin.flush()
+        except OSError as e:
+            logger.error(f"Failed to submit job to spotdl worker: {e}")
+            self._kill_worker()
+            return []
+
+        ok_ids: set[str] = set()
+        done = False
+        stdout_tail = b""
+        stderr_buf: list[bytes] = []
+
+        # Block in the kernel until a pipe has data; the select timeout
+        # only bounds cancellation latency. Pipes stay binary and stderr is
+        # decoded once, on the failure path only.
+        sel = DefaultSelector()
+        sel.register(proc.stdout, EVENT_READ)
+        sel.register(proc.stderr, EVENT_READ)
+
+        try:
+            while not done and sel.get_map():
+                if cancel_event and cancel_event.is_set():
+                    logger.info("Cancellation detected. Terminating spotdl worker.")
+                    self._kill_worker()
+                    self._cleanup_partials()
+                    return self._succeeded_songs(songs)
+
+                for key, _ in sel.select(timeout=1.0):
                     try:
-                        if proc.stdout and proc.stdout.readable():
-                            line = proc.stdout.readline()
-                            if line:
-                                stdout_lines.append(line)
-                                if self.verbose:
-                                    logger.info(f"STDOUT: {line.strip()}")
-                        if proc.stderr and proc.stderr.readable():
-                            line = proc.stderr.readline()
-                            if line:
-                                stderr_lines.append(line)
-                                if self.verbose:
-                                    logger.error(f"STDERR: {line.strip()}")
-                    except Exception as e:
-                        logger.error(
-                            f"Error reading process output for {song.url}: {e}"
-                        )
-                    sleep(0.2)
-
-                # Process has finished, read any remaining output
-                out, err = proc.communicate()
-                if out:
-                    stdout_lines.append(out)
-                    if self.verbose:
-                        logger.info(f"STDOUT: {out.strip()}")
-                if err:
-                    stderr_lines.append(err)
-                    if self.verbose:
-                        logger.error(f"STDERR: {err.strip()}")
-
-                if proc.returncode == 0:
-                    logger.info(f"Successfully downloaded {song.url}")
-                    return True
-                else:
-                    logger.error(
-                        f"Download failed for {song.url} with exit code {proc.returncode}.\n"
-                        f"STDOUT:\n{''.join(stdout_lines)}\nSTDERR:\n{''.join(stderr_lines)}"
-                    )
-
-            except FileNotFoundError:
-                logger.error(
-                    "SpotDL command not found. Please ensure spotdl is installed and in your PATH."
-                )
-                break
-            except Exception as e:
-                logger.error(
-                    f"Exception during download of {song.url}: {e}", exc_info=True
-                )
-            finally:
-                if proc and proc.poll() is None:
-                    logger.warning(
-                        f"Force killing process for {song.url} due to unhandled exception."
-                    )
-                    proc.kill()
+                        chunk = _os_read(key.fileobj.fileno(), _READ_CHUNK)
+                    except OSError as e:
+                        logger.error(f"Error reading spotdl worker output: {e}")
+                        sel.unregister(key.fileobj)
+                        continue
+                    if not chunk:
+                        sel.unregister(key.fileobj)
+                        continue
+                    if key.fileobj is not proc.stdout:
+                        stderr_buf.append(chunk)
+                        continue
 
+                    lines = (stdout_tail + chunk).split(b"\n")
+                    stdout_tail = lines.pop()
+                    for raw in lines:
+                        line = raw.decode("utf-8", "replace").strip()
+                        if line == "DONE":
+                            done = True
+                        elif line.startswith("OK "):
+                            ok_ids.add(_track_id(line[3:]))
+                            # Only successes tick the callback: the caller's
+                            # bar tracks the downloaded set across retries.
+                            if progress_cb:
+                                progress_cb(1)
+        finally:
+            sel.close()
+
+        if not done:
+            # Worker died mid-batch; surface its stderr and force a respawn
+            # on the next call, then fall back to the archive for attribution.
+            stderr_text = b"".join(stderr_buf).decode("utf-8", "replace")
+            logger.error(
+                f"spotdl worker exited before completing the batch.\n"
+                f"STDERR:\n{stderr_text}"
+            )
+            self._kill_worker()
             self._cleanup_partials()
-            if attempt < max_attempts and (
-                cancel_event is None or not cancel_event.is_set()
-            ):
-                sleep(backoff_factor**attempt)
+            return self._succeeded_songs(songs)
 
-        logger.error(f"Failed to download {song.url} after {max_attempts} attempts.")
-        return False
+        succeeded = [s for s in songs if _track_id(s.url) in ok_ids]
+        if len(succeeded) < len(songs):
+            self._cleanup_partials()
+        return succeeded
@@ -1,15 +1,49 @@
 from __future__ import annotations
 from subprocess import Popen, PIPE, TimeoutExpired
-from re import sub
+from threading import Event
+from time import monotonic
 from typing import List
 from json import loads as _json_loads
 from sopti.models import SongRecord
 from sopti.utils.logging import setup_logging
 from sopti.config import Config
-from sopti.spotify_api import SpotifyAPIClient
+from sopti.spotify_api import get_client
+from sopti.utils.cli import resolve_tool
 
 logger = setup_logging(__name__)
 
+# Deletion table mapping everything but ASCII alphanumerics to None;
+# str.translate runs as a single C pass over the (ASCII) URL, versus the
+# regex engine's per-character dispatch.
+_SAFE_ID_TABLE = str.maketrans(
+    "", "", "".join(chr(c) for c in range(128) if not chr(c).isalnum())
+)
+
+# Keys that can carry the playlist name in a spotdl meta song dict. "name"
+# and "title" are deliberately absent: on these payloads they hold the
+# track title, not the playlist.
+_NAME_KEYS = ("list_name", "playlist_name")
+
+# How often the meta wait wakes up to check for cancellation.
+_META_POLL_INTERVAL = 1.0
+
+# Overall cap on one meta fetch. Generous because spotdl resolves whole
+# playlists here, but bounded so a hung subprocess cannot wedge a sync
+# run forever. The old per-name lookup used 30s; extraction needs more.
+_META_TIMEOUT = 300.0
+
+
+def _name_from(item: dict) -> str | None:
+    return next(
+        (
+            v.strip()
+            for k in _NAME_KEYS
+            for v in [item.get(k)]
+            if isinstance(v, str) and v.strip()
+        ),
+        None,
+    )
+
 
 class PlaylistExtractor:
     def __init__(
@@ -18,11 +52,28 @@ class PlaylistExtractor:
         client_id: str | None = None,
         client_secret: str | None = None,
         user_auth: bool = False,
+        cancel_event: Event | None = None,
     ):
         self.profile_url = profile_url.rstrip(":")
         self.client_id = client_id
         self.client_secret = client_secret
         self.user_auth = user_auth
+        # Checked while waiting on the meta subprocess so Ctrl+C during
+        # extraction terminates it promptly.
+        self.cancel_event = cancel_event
+        # Resolve the binary once and spawn with the absolute path; execvp
+        # no longer walks PATH per call and a missing install fails here
+        # instead of after several retries.
+        self._spotdl_bin = resolve_tool("spotdl")
+        if not self._spotdl_bin:
+            raise RuntimeError(
+                "spotdl not found in PATH. Please ensure spotdl is installed."
+            )
+        # Memoized by get_playlist_name so repeat callers skip the network.
+        self._playlist_name: str | None = None
+        # One `spotdl meta --json` call serves both track extraction and the
+        # playlist name; cached after the first fetch.
+        self._meta: list[dict] | None = None
 
         config = Config()
         # Prioritize explicit client_id/secret, then config, then empty string
@@ -30,9 +81,10 @@ class PlaylistExtractor:
         spotify_client_secret = self.client_secret or config.data.get(
             "spotify_client_secret", ""
         )
-        self.spotify_api_client = SpotifyAPIClient(
-            client_id=spotify_client_id,
-            client_secret=spotify_client_secret,
+        # Shared per credential pair: extractors in a multi-profile batch
+        # reuse one authenticated client and its connection pool.
+        self.spotify_api_client = get_client(
+            spotify_client_id, spotify_client_secret
         )
         if not spotify_client_id or not spotify_client_secret:
             logger.warning(
@@ -46,7 +98,7 @@ class PlaylistExtractor:
             )
 
     def _build_base_cmd(self, subcommand: str) -> list[str]:
-        cmd = ["spotdl", subcommand, self.profile_url]
+        cmd = [self._spotdl_bin, subcommand, self.profile_url]
         if self.client_id:
             cmd.extend(["--client-id", self.client_id])
         if self.client_secret:
@@ -55,8 +107,117 @@ class PlaylistExtractor:
             cmd.append("--user-auth")
         return cmd
 
+    def _kill_proc(self, proc: Popen) -> None:
+        proc.terminate()
+        try:
+            proc.wait(timeout=5)
+        except TimeoutExpired:
+            proc.kill()
+
+    def _wait_for_meta(self, proc: Popen) -> tuple[bytes, bytes]:
+        """Wait for the meta subprocess, polling the cancel event.
+
+        communicate() with a short timeout keeps draining the pipes
+        between polls, so a cancelled run terminates the child within a
+        poll interval instead of blocking until it exits on its own. A
+        subprocess still running at the deadline is killed and reported.
+        """
+        deadline = monotonic() + _META_TIMEOUT
+        while True:
+            try:
+                return proc.communicate(timeout=_META_POLL_INTERVAL)
+            except TimeoutExpired:
+                if self.cancel_event is not None and self.cancel_event.is_set():
+                    logger.info("Playlist metadata fetch cancelled.")
+                    self._kill_proc(proc)
+                    raise RuntimeError("Playlist metadata fetch cancelled.")
+                if monotonic() >= deadline:
+                    logger.error(
+                        f"SpotDL meta command timed out after {_META_TIMEOUT:.0f}s "
+                        f"for {self.profile_url}."
+                    )
+                    self._kill_proc(proc)
+                    raise RuntimeError(
+                        f"Playlist metadata fetch timed out after {_META_TIMEOUT:.0f}s."
+                    )
+
+    def _fetch_meta(self) -> list[dict]:
+        """Run `spotdl meta --json` once and cache the parsed song dicts.
+
+        The payload carries track URLs, per-track metadata and the playlist
+        name, so a single subprocess serves both extract() and
+        get_playlist_name().
+        """
+        if self._meta is not None:
+            return self._meta
+
+        cmd = self._build_base_cmd("meta")
+        cmd.append("--json")
+        proc: Popen | None = None
+
+        try:
+            # Binary pipes: json.loads accepts bytes directly, so the
+            # potentially multi-MB payload skips the str conversion.
+            proc = Popen(cmd, stdout=PIPE, stderr=PIPE)
+            out, err = self._wait_for_meta(proc)
+        except KeyboardInterrupt:
+            logger.info("Playlist metadata fetch interrupted by user.")
+            if proc:
+                self._kill_proc(proc)
+            raise
+        except Exception as e:
+            logger.error(
+                f"Exception during metadata fetch for {self.profile_url}: {e}",
+                exc_info=True,
+            )
+            raise RuntimeError(f"Failed to fetch playlist metadata: {e}")
+        finally:
+            if proc and proc.poll() is None:
+                proc.kill()
+
+        if proc.returncode != 0:
+            error_msg = (
+                f"SpotDL meta command failed for {self.profile_url}. "
+                f"Return code: {proc.returncode}.\n"
+                f"STDERR:\n{err.decode('utf-8', 'replace')}"
+            )
+            logger.error(error_msg)
+            raise RuntimeError(error_msg)
+
+        try:
+            data = _json_loads(out)
+        except Exception as e:
+            logger.error(f"Failed to parse SpotDL meta JSON for {self.profile_url}: {e}")
+            raise RuntimeError(f"Failed to parse playlist metadata: {e}")
+
+        if isinstance(data, dict):
+            data = [data]
+        if not isinstance(data, list):
+            raise RuntimeError(
+                f"Unexpected SpotDL meta payload for {self.profile_url}."
+            )
+
+        self._meta = [item for item in data if isinstance(item, dict)]
+        return self._meta
+
+    def _name_from_meta(self, meta: list[dict]) -> str | None:
+        return next((n for item in meta for n in [_name_from(item)] if n), None)
+
     def get_playlist_name(self) -> str:
-        # Attempt to get playlist name from Spotify API first
+        if self._playlist_name is None:
+            self._playlist_name = self._fetch_playlist_name()
+        return self._playlist_name
+
+    def _fetch_playlist_name(self) -> str:
+        # Metadata fetched during extract() already carries the name; no
+        # extra round-trip when the orchestrator asks afterwards.
+        if self._meta is not None:
+            cached = self._name_from_meta(self._meta)
+            if cached:
+                logger.info(f"Extracted playlist name from cached meta: {cached}")
+                return cached
+
+        # Attempt to get playlist name from Spotify API next
         try:
             api_name = self.spotify_api_client.get_playlist_name(self.profile_url)
             if api_name:
@@ -71,64 +232,16 @@ class PlaylistExtractor:
                 f"Error using Spotify API to get playlist name: {e}. Falling back to SpotDL meta command."
             )
 
-        # Fallback to spotdl meta command
-        cmd = self._build_base_cmd("meta")
-        cmd.append("--json")
-
-        proc: Popen | None = None
+        # Fallback to spotdl meta payload
         try:
-            proc = Popen(cmd, stdout=PIPE, stderr=PIPE, text=True)
-            out, err = proc.communicate(timeout=30)
-
-            if proc.returncode == 0 and out:
-                try:
-                    data = _json_loads(out)
-                    candidate = None
-                    if isinstance(data, dict):
-                        for key in ("name", "title", "playlist_name"):
-                            val = data.get(key)
-                            if isinstance(val, str) and val.strip():
-                                candidate = val.strip()
-                                break
-                    if candidate is None and isinstance(data, list):
-                        for item in data:
-                            if isinstance(item, dict):
-                                for key in ("name", "title", "playlist_name"):
-                                    val = item.get(key)
-                                    if isinstance(val, str) and val.strip():
-                                        candidate = val.strip()
-                                        break
-                            if candidate:
-                                break
-                    if candidate:
-                        logger.info(
-                            f"Extracted playlist name from SpotDL meta: {candidate}"
-                        )
-                        return candidate
-                except Exception as e:
-                    logger.warning(
-                        f"Failed to parse JSON for playlist name from {self.profile_url}: {e}"
-                    )
-            else:
-                logger.warning(
-                    f"SpotDL meta command failed for {self.profile_url}. Return code: {proc.returncode}, Error: {err.strip()}"
-                )
-        except TimeoutExpired:
-            logger.error(f"SpotDL meta command timed out for {self.profile_url}.")
-            if proc:
-                proc.kill()
-        except FileNotFoundError:
-            logger.error(
-                "SpotDL command not found. Please ensure spotdl is installed and in your PATH."
-            )
+            candidate = self._name_from_meta(self._fetch_meta())
+            if candidate:
+                logger.info(f"Extracted playlist name from SpotDL meta: {candidate}")
+                return candidate
         except Exception as e:
-            logger.error(
-                f"Exception during playlist name extraction with SpotDL meta for {self.profile_url}: {e}",
-                exc_info=True,
+            logger.warning(
+                f"Failed to get playlist name from SpotDL meta for {self.profile_url}: {e}"
             )
-        finally:
-            if proc and proc.poll() is None:
-                proc.kill()
 
         # Final fallback: derive from URL path, strip query params like ?si=...
         url = self.profile_url.split("?")[0].rstrip("/")
@@ -139,91 +252,29 @@ class PlaylistExtractor:
         return fallback_name
 
     def extract(self) -> List[SongRecord]:
-        cmd = self._build_base_cmd("url")
-        proc: Popen | None = None
-        stdout_chunks: list[str] = []
-        stderr_chunks: list[str] = []
-
-        try:
-            proc = Popen(cmd, stdout=PIPE, stderr=PIPE, text=True)
-            while proc.poll() is None:
-                try:
-                    if proc.stdout and proc.stdout.readable():
-                        line = proc.stdout.readline()
-                        if line:
-                            stdout_chunks.append(line)
-                            logger.debug(f"SpotDL STDOUT: {line.strip()}")
-                    if proc.stderr and proc.stderr.readable():
-                        line = proc.stderr.readline()
-                        if line:
-                            stderr_chunks.append(line)
-                            logger.debug(f"SpotDL STDERR: {line.strip()}")
-                except Exception as e:
-                    logger.warning(f"Error reading process output: {e}")
-
-            # Ensure all output is read after process exits
-            out, err = proc.communicate()
-            if out:
-                stdout_chunks.append(out)
-            if err:
-                stderr_chunks.append(err)
-
-        except KeyboardInterrupt:
-            logger.info("Playlist extraction interrupted by user.")
-            if proc:
-                proc.terminate()
-                try:
-                    proc.wait(timeout=5)
-                except TimeoutExpired:
-                    proc.kill()
-            raise
-        except FileNotFoundError:
-            logger.error(
-                "SpotDL command not found. Please ensure spotdl is installed and in your PATH."
-            )
-            raise RuntimeError("SpotDL not found.")
-        except Exception as e:
-            logger.error(
-                f"Exception during URL extraction for {self.profile_url}: {e}",
-                exc_info=True,
-            )
-            raise RuntimeError(f"Failed to extract playlist URLs: {e}")
-        finally:
-            if proc and proc.poll() is None:
-                proc.kill()
+        songs_meta = self._fetch_meta()
 
-        stdout = "".join(stdout_chunks)
-        stderr = "".join(stderr_chunks)
+        # Dedup by URL in one order-preserving pass.
+        by_url: dict[str, dict] = {}
+        for item in songs_meta:
+            url = (item.get("url") or "").strip()
+            if url and url not in by_url:
+                by_url[url] = item
 
-        if proc is None or proc.returncode != 0:
-            error_msg = f"SpotDL URL command failed for {self.profile_url}. Return code: {proc.returncode if proc else 'N/A'}.\nSTDERR:\n{stderr}"
-            logger.error(error_msg)
-            raise RuntimeError(error_msg)
-
-        urls = [line.strip() for line in stdout.splitlines() if line.strip()]
-        if not urls:
+        if not by_url:
             logger.info(f"No URLs extracted for {self.profile_url}.")
             return []
 
-        seen: set[str] = set()
-        unique_urls: list[str] = []
-        for u in urls:
-            if u not in seen:
-                seen.add(u)
-                unique_urls.append(u)
-
-        logger.info(f"Extracted {len(unique_urls)} unique URLs for {self.profile_url}.")
-
-        records: List[SongRecord] = []
-        for url in unique_urls:
-            safe_id = sub(r"[^a-zA-Z0-9]", "", url)[-32:]
-            record = SongRecord(
-                id=safe_id,
-                title="",  # spotdl url command doesn't provide metadata
-                artists=[],
-                album="",
+        logger.info(f"Extracted {len(by_url)} unique URLs for {self.profile_url}.")
+
+        return [
+            SongRecord(
+                id=url.translate(_SAFE_ID_TABLE)[-32:],
+                title=item.get("name") or "",
+                artists=list(item.get("artists") or []),
+                album=item.get("album_name") or "",
                 playlist_id="unknown",
                 url=url,
             )
-            records.append(record)
-        return records
+            for url, item in by_url.items()
+        ]
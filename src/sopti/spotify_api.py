@@ -1,16 +1,40 @@
 from __future__ import annotations
+import atexit
+import re
+import requests
 import spotipy
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 from spotipy.oauth2 import SpotifyClientCredentials
+from threading import Lock
 from sopti.utils.logging import setup_logging
 
 logger = setup_logging(__name__)
 
+# Matches Spotify playlist references and captures the 22-char ID:
+# https://open.spotify.com/playlist/37i9dQZF1DXcBWIGoYBM5M
+# spotify:playlist:37i9dQZF1DXcBWIGoYBM5M
+# 37i9dQZF1DXcBWIGoYBM5M (direct ID)
+_PLAYLIST_ID_RE = re.compile(r"(?:playlist[/:])?([a-zA-Z0-9]{22})")
+
+_PLAYLIST_URL_PREFIX = "https://open.spotify.com/playlist/"
+_PLAYLIST_ID_LEN = 22
+
 
 class SpotifyAPIClient:
     def __init__(self, client_id: str, client_secret: str):
         self.client_id = client_id
         self.client_secret = client_secret
         self._sp_client = None
+        # Pooled HTTP session shared by API calls and token refreshes, so
+        # repeat requests reuse one TLS connection instead of handshaking
+        # per call. Created lazily alongside the client.
+        self._session: requests.Session | None = None
+        # Name lookups keyed by playlist ID; repeat calls for the same
+        # playlist (retries, multiple passes) become a dict hit instead of
+        # an HTTP round-trip. Failed lookups are cached too, so a bad ID
+        # is not re-fetched within the process.
+        self._name_cache: dict[str, str | None] = {}
 
     def _get_spotify_client(self) -> spotipy.Spotify | None:
         if not self.client_id or not self.client_secret:
@@ -28,11 +52,18 @@ class SpotifyAPIClient:
                     )
                     return None
 
+                if self._session is None:
+                    self._session = requests.Session()
+                    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=10)
+                    self._session.mount("https://", adapter)
+
                 self._sp_client = spotipy.Spotify(
                     client_credentials_manager=SpotifyClientCredentials(
                         client_id=self.client_id,
                         client_secret=self.client_secret,
-                    )
+                        requests_session=self._session,
+                    ),
+                    requests_session=self._session,
                 )
                 logger.info(
                     f"Spotify API client initialized successfully with client ID: {self.client_id[:4]}...{self.client_id[-4:]}"
@@ -42,30 +73,68 @@ class SpotifyAPIClient:
                 self._sp_client = None
         return self._sp_client
 
+    def close(self) -> None:
+        """Release the pooled HTTP session and its connections."""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+        self._sp_client = None
+
     def _extract_playlist_id(self, playlist_url: str) -> str | None:
-        # Regex to match Spotify playlist URLs and extract the ID
-        # Handles formats like:
-        # https://open.spotify.com/playlist/37i9dQZF1DXcBWIGoYBM5M
-        # spotify:playlist:37i9dQZF1DXcBWIGoYBM5M
-        # 37i9dQZF1DXcBWIGoYBM5M (direct ID)
-        import re
-
-        match = re.search(r"(?:playlist[/:])?([a-zA-Z0-9]{22})", playlist_url)
-        if match:
-            return match.group(1)
-        return None
+        # Fast path for the dominant share-link shape: slice the ID out
+        # after the known prefix and validate with isalnum, no regex.
+        # spotify: URIs and bare IDs fall through to the pattern.
+        if playlist_url.startswith(_PLAYLIST_URL_PREFIX):
+            start = len(_PLAYLIST_URL_PREFIX)
+            candidate = playlist_url[start : start + _PLAYLIST_ID_LEN]
+            if len(candidate) == _PLAYLIST_ID_LEN and candidate.isalnum():
+                return candidate
 
-    def get_playlist_name(self, playlist_url: str) -> str | None:
-        sp = self._get_spotify_client()
-        if sp is None:
-            logger.warning("Spotify client not available. Cannot fetch playlist name.")
-            return None
+        match = _PLAYLIST_ID_RE.search(playlist_url)
+        return match.group(1) if match else None
 
+    def get_playlist_name(self, playlist_url: str) -> str | None:
         playlist_id = self._extract_playlist_id(playlist_url)
         if not playlist_id:
             logger.warning(f"Could not extract playlist ID from URL: {playlist_url}")
             return None
 
+        if playlist_id in self._name_cache:
+            return self._name_cache[playlist_id]
+
+        name = self._fetch_playlist_name(playlist_url, playlist_id)
+        self._name_cache[playlist_id] = name
+        return name
+
+    def get_playlist_names(
+        self, playlist_urls: list[str]
+    ) -> dict[str, str | None]:
+        """Resolve names for several playlists concurrently.
+
+        Spotify has no multi-playlist endpoint, so the lookups fan out
+        over a small thread pool sharing the pooled session; N serialized
+        round-trips become ceil(N/8). Results land in the per-ID cache,
+        so later get_playlist_name calls are dict hits.
+        """
+        unique = list(dict.fromkeys(playlist_urls))
+        if len(unique) <= 1:
+            return {url: self.get_playlist_name(url) for url in unique}
+
+        # Initialize the client once up front so worker threads don't
+        # race the lazy construction.
+        self._get_spotify_client()
+        with ThreadPoolExecutor(max_workers=min(len(unique), 8)) as executor:
+            names = executor.map(self.get_playlist_name, unique)
+        return dict(zip(unique, names))
+
+    def _fetch_playlist_name(
+        self, playlist_url: str, playlist_id: str
+    ) -> str | None:
+        sp = self._get_spotify_client()
+        if sp is None:
+            logger.warning("Spotify client not available. Cannot fetch playlist name.")
+            return None
+
         try:
             playlist = sp.playlist(playlist_id)
             if playlist and "name" in playlist:
@@ -89,3 +158,26 @@ class SpotifyAPIClient:
                 exc_info=True,
             )
             return None
+
+
+# Clients cached per credential pair: every extractor in a multi-profile
+# batch reuses the same authenticated client, token and connection pool.
+# Shared clients are closed at process exit rather than per run.
+_INSTANCES: dict[tuple[str, str], SpotifyAPIClient] = {}
+_INSTANCES_LOCK = Lock()
+
+
+def _close_all() -> None:
+    for client in _INSTANCES.values():
+        client.close()
+
+
+def get_client(client_id: str, client_secret: str) -> SpotifyAPIClient:
+    key = (client_id, client_secret)
+    with _INSTANCES_LOCK:
+        client = _INSTANCES.get(key)
+        if client is None:
+            if not _INSTANCES:
+                atexit.register(_close_all)
+            client = _INSTANCES[key] = SpotifyAPIClient(client_id, client_secret)
+    return client
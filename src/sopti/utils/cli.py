@@ -1,27 +1,31 @@
 from __future__ import annotations
 from argparse import ArgumentTypeError
+from functools import cache
 from shutil import which
 from .logging import setup_logging
 
 logger = setup_logging(__name__)
 
+_SPOTIFY_PREFIX = "https://open.spotify.com/"
+
+
+@cache
+def resolve_tool(name: str) -> str | None:
+    """shutil.which with a process-lifetime cache; PATH walks happen once."""
+    return which(name)
+
 
 def positive_int(value: str) -> int:
-    try:
-        iv = int(value)
-        if iv <= 0:
-            raise ArgumentTypeError("workers must be a positive integer")
-        return iv
-    except ValueError:
+    # isdecimal() rejects signs and non-numerics up front, so the valid
+    # path never enters a try/except and int() cannot raise below.
+    s = value.strip()
+    if not s.isdecimal() or (iv := int(s)) <= 0:
         raise ArgumentTypeError("workers must be a positive integer")
+    return iv
 
 
 def ensure_dependencies() -> None:
-    missing: list[str] = []
-    if which("spotdl") is None:
-        missing.append("spotdl")
-    if which("ffmpeg") is None:
-        missing.append("ffmpeg")
+    missing = [tool for tool in ("spotdl", "ffmpeg") if resolve_tool(tool) is None]
     if missing:
         logger.error(
             "Missing dependencies: "
@@ -32,4 +36,4 @@ def ensure_dependencies() -> None:
 
 
 def looks_like_spotify_url(url: str) -> bool:
-    return url.startswith("https://open.spotify.com/")
+    return url.startswith(_SPOTIFY_PREFIX)
@@ -1,18 +1,67 @@
 from __future__ import annotations
+import atexit
 import logging
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener
 from pathlib import Path
+from queue import SimpleQueue
+from .path_utils import ensure_dir
+
+_LOG_DIR = Path.home() / ".cache" / "sopti"
+
+# Nothing here logs thread/process identifiers, so skip collecting them
+# when each record is created.
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
+# Lazily started background pipeline: loggers enqueue records, a single
+# listener thread batches them through a MemoryHandler into the file, so
+# worker threads never block on disk writes or the handler lock.
+_queue: SimpleQueue | None = None
+_listener: QueueListener | None = None
+_memory_handler: MemoryHandler | None = None
+
+
+def _get_queue() -> SimpleQueue:
+    global _queue, _listener, _memory_handler
+    if _queue is None:
+        ensure_dir(_LOG_DIR)
+        file_handler = logging.FileHandler(_LOG_DIR / "sopti.log")
+        # Explicit datefmt: the default formats the full date plus
+        # milliseconds, which runs strftime twice per record.
+        file_handler.setFormatter(
+            logging.Formatter(
+                "%(asctime)s - %(levelname)s - %(message)s",
+                datefmt="%Y-%m-%d %H:%M:%S",
+            )
+        )
+        # Buffer up to 256 records per write; errors flush immediately.
+        _memory_handler = MemoryHandler(
+            capacity=256, target=file_handler, flushLevel=logging.ERROR
+        )
+        _queue = SimpleQueue()
+        _listener = QueueListener(
+            _queue, _memory_handler, respect_handler_level=True
+        )
+        _listener.start()
+        atexit.register(_shutdown)
+    return _queue
+
+
+def _shutdown() -> None:
+    if _listener is not None:
+        _listener.stop()
+    if _memory_handler is not None:
+        _memory_handler.close()
 
 
 def setup_logging(name: str) -> logging.Logger:
     logger = logging.getLogger(name)
-    logger.setLevel(logging.INFO)
+    # getLogger returns the same object per name, so a second setup call
+    # would stack another handler and duplicate every line; bail early.
+    if logger.handlers:
+        return logger
 
-    # Ensure the cache directory exists for the log file
-    log_dir = Path.home() / ".cache" / "sopti"
-    log_dir.mkdir(parents=True, exist_ok=True)
-
-    handler = logging.FileHandler(log_dir / "sopti.log")
-    formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
-    handler.setFormatter(formatter)
-    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    logger.addHandler(QueueHandler(_get_queue()))
     return logger
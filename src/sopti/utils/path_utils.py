@@ -1,13 +1,24 @@
 from __future__ import annotations
 from pathlib import Path
-from re import sub as _re_sub
+from re import compile as _re_compile
+
+# Compiled once so each call skips the re._compile cache lookup.
+_SAFE_PAT = _re_compile(r"[^\w\-\. ]+")
+
+# Directories already created this process; repeat callers pay a set
+# lookup instead of an mkdir syscall.
+_READY_DIRS: set[str] = set()
+
+
+def ensure_dir(path: Path) -> Path:
+    key = str(path)
+    if key not in _READY_DIRS:
+        path.mkdir(parents=True, exist_ok=True)
+        _READY_DIRS.add(key)
+    return path
 
 
 def safe_folder_name(name: str, base_path: Path) -> Path:
-    safe = _re_sub(r"[^\w\-\. ]+", "_", name).strip("._ ")
-    if not safe:
-        safe = "playlist"
-    # Truncate to avoid OS path length issues
-    if len(safe) > 80:
-        safe = safe[:80]
+    # Truncated to 80 chars to avoid OS path length issues.
+    safe = _SAFE_PAT.sub("_", name).strip("._ ")[:80] or "playlist"
     return base_path / safe